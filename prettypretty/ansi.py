@@ -70,15 +70,24 @@ class Ansi(enum.StrEnum):
         empty string. It also inserts semicolons between parameters, i.e., when
         two successive arguments are either ``None`` or an integer.
         """
+        # Prebuilt sequences are passed as a single string.
+        if len(fragments) == 1 and isinstance(fragments[0], str):
+            return str(fragments[0])
+
         processed: list[str] = []
         previous_was_parameter = False
 
         for fragment in fragments:
-            current_is_parameter = fragment is None or isinstance(fragment, int)
-            if previous_was_parameter and current_is_parameter:
+            if isinstance(fragment, str):
+                processed.append(fragment)
+                previous_was_parameter = False
+                continue
+
+            if previous_was_parameter:
                 processed.append(';')
-            processed.append('' if fragment is None else str(fragment))
-            previous_was_parameter = current_is_parameter
+            if fragment is not None:
+                processed.append(str(fragment))
+            previous_was_parameter = True
 
         return ''.join(processed)
 
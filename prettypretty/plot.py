@@ -104,15 +104,16 @@ class ColorPlotter:
         l, c, h = oklch[0], oklch[1], oklch[2]
         c = round(c, 14)  # Chop off one digit of precision.
 
-        # Update status
-        light = f'{l:.5}'
-        if len(light) > 7:
-            light = f'{l:.5f}'
-        chroma = f'{c:.5}'
-        if len(chroma) > 7:
-            chroma = f'{c:.5f}'
-        hue = f'{h:.1f}'
-        self.status(f"{name:14}  {hex_color}  {light:<7}  {chroma:<7}  {hue:>5}")
+        # Update status, but only format it if it is shown
+        if not self._silent:
+            light = f'{l:.5}'
+            if len(light) > 7:
+                light = f'{l:.5f}'
+            chroma = f'{c:.5}'
+            if len(chroma) > 7:
+                chroma = f'{c:.5f}'
+            hue = f'{h:.1f}'
+            self.status(f"{name:14}  {hex_color}  {light:<7}  {chroma:<7}  {hue:>5}")
 
         # Handle grays
         if c < 1e-9 or math.isnan(h):
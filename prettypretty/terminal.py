@@ -14,7 +14,6 @@ from typing import (
     ClassVar,
     ContextManager,
     Literal,
-    Never,
     overload,
     Self,
     TextIO,
@@ -37,11 +36,117 @@ class TerminalModeComponent:
     LFLAG = 3
 
 
+# The local mode flags that cbreak mode clears.
+_CBREAK_LFLAGS = termios.ECHO | termios.ICANON
+
+
 _REFLECTED_METHODS = {
     'write_control', 'at', 'column', 'down', 'left', 'link', 'right', 'up'
 }
 
 
+# Queries and response prefixes for the 18 theme colors, indexed by theme entry.
+# OSC 10 and 11 cover the default foreground and background colors, OSC 4 the
+# 16 extended ANSI colors. Building them once avoids fusing fragments for every
+# single request.
+_COLOR_QUERIES: tuple[str, ...] = (
+    *(f'{Ansi.OSC}{10 + index};?{Ansi.ST}' for index in range(2)),
+    *(f'{Ansi.OSC}4;{color};?{Ansi.ST}' for color in range(16)),
+)
+
+# Response prefixes are bytes and include the "rgb:" of the X Windows format.
+_COLOR_PREFIXES: tuple[bytes, ...] = (
+    *(f'{Ansi.OSC}{10 + index};rgb:'.encode('ascii') for index in range(2)),
+    *(f'{Ansi.OSC}4;{color};rgb:'.encode('ascii') for color in range(16)),
+)
+
+_COLOR_NAMES: tuple[str, ...] = tuple(
+    ThemeEntry.from_index(index).name() for index in range(18)
+)
+
+# The same queries, ready for make_raw_requests() and as one string for writing
+# all of them at once.
+_THEME_REQUESTS: tuple[tuple[str], ...] = tuple((query,) for query in _COLOR_QUERIES)
+_THEME_QUERY: str = ''.join(_COLOR_QUERIES)
+
+
+# Byte classes for parsing control sequences. Each table maps a byte to 1 if it
+# belongs to the class and to 0 otherwise, so that the parser needs only one
+# lookup per byte instead of two comparisons.
+def _byte_class(first: int, last: int) -> bytes:
+    return bytes(first <= b <= last for b in range(256))
+
+
+_PARAMETER_BYTE = _byte_class(0x30, 0x3F)
+_INTERMEDIATE_BYTE = _byte_class(0x20, 0x2F)
+_CSI_FINAL_BYTE = _byte_class(0x40, 0x7E)
+_ESC_FINAL_BYTE = _byte_class(0x30, 0x7E)
+_STRING_INTRODUCER = bytes(b in b'PX]^_' for b in range(256))
+
+
+def _scan_control(data: bytearray, start: int = 0) -> int:
+    """
+    Scan the control sequence at the start of the data. If the sequence is
+    complete, this function returns its length. If it is incomplete, this
+    function returns 0. If it is malformed, this function returns the negated
+    length up to and including the unexpected byte.
+
+    When rescanning an incomplete sequence after more data has arrived, the
+    start index lets the scan for a DCS/SOS/OSC/PM/APC terminator resume where
+    the previous scan left off instead of searching the entire payload again.
+    """
+    # TODO: Support ESC, CAN, SUB for cancellation
+
+    n = len(data)
+    if n == 0:
+        return 0
+    if data[0] != 0x1B:
+        return -1
+    if n == 1:
+        return 0
+
+    # CSI Control Sequence
+    # --------------------
+
+    b = data[1]
+    if b == 0x5B:  # [
+        pos = 2
+        while pos < n and _PARAMETER_BYTE[data[pos]]:
+            pos += 1
+        while pos < n and _INTERMEDIATE_BYTE[data[pos]]:
+            pos += 1
+        if pos == n:
+            return 0
+        return pos + 1 if _CSI_FINAL_BYTE[data[pos]] else -(pos + 1)
+
+    # DCS/SOS/OSC/PM/APC Control Sequence (Ending in ST)
+    # --------------------------------------------------
+
+    if _STRING_INTRODUCER[b]:  # P,X,],^,_
+        # Scan for BEL or ESC in bulk instead of byte by byte
+        start = max(start, 2)
+        bel = data.find(0x07, start)
+        esc = data.find(0x1B, start)
+        index = bel if esc < 0 or 0 <= bel < esc else esc
+        if index < 0:
+            return 0
+        if data[index] == 0x07:
+            return index + 1
+        if index + 1 == n:
+            return 0
+        return index + 2 if data[index + 1] == 0x5C else -(index + 2)  # \\
+
+    # Escape Sequence
+    # ---------------
+
+    pos = 1
+    while pos < n and _INTERMEDIATE_BYTE[data[pos]]:
+        pos += 1
+    if pos == n:
+        return 0
+    return pos + 1 if _ESC_FINAL_BYTE[data[pos]] else -(pos + 1)
+
+
 class BatchMode(enum.Enum):
     """
     A terminal's `batch mode
@@ -145,14 +250,22 @@ class TerminalContextManager(AbstractContextManager['Terminal']):
 
     @contextmanager
     def _cbreak_mode(self) -> 'Iterator[Terminal]':
-        fileno = self._terminal._input_fileno  # type: ignore[reportPrivateUsage]
+        terminal = self._terminal
+        fileno = terminal._input_fileno  # type: ignore[reportPrivateUsage]
         saved_mode = termios.tcgetattr(fileno)
-        if not self._terminal.is_cbreak_mode(saved_mode):
+        was_cbreak = terminal.is_cbreak_mode(saved_mode)
+        if not was_cbreak:
             tty.setcbreak(fileno)
+
+        # Let check_cbreak_mode() skip querying the terminal mode.
+        saved_known = terminal._cbreak_known  # type: ignore[reportPrivateUsage]
+        terminal._cbreak_known = True  # type: ignore[reportPrivateUsage]
         try:
-            yield self._terminal
+            yield terminal
         finally:
-            termios.tcsetattr(fileno, termios.TCSAFLUSH, saved_mode)
+            if not was_cbreak:
+                termios.tcsetattr(fileno, termios.TCSAFLUSH, saved_mode)
+            terminal._cbreak_known = saved_known  # type: ignore[reportPrivateUsage]
 
     def cbreak_mode(self) -> Self:
         """
@@ -161,9 +274,9 @@ class TerminalContextManager(AbstractContextManager['Terminal']):
         If the terminal is not yet in cbreak mode, the context manager sets
         cbreak mode upon entry and restores the previous mode upon exit. If the
         terminal is in cbreak mode already, the context manager does not modify
-        the terminal mode, but it still restores the previous mode upon exit.
-        Mode changes only take effect after all queued output has been written
-        but queued input is discarded.
+        the terminal mode, neither upon entry nor upon exit. Mode changes only
+        take effect after all queued output has been written but queued input is
+        discarded.
         """
         self._check_not_active()
         self._updates.append(lambda: self._cbreak_mode())
@@ -338,11 +451,11 @@ class Terminal:
          3. Parse text to extract terminal name, colors, etc.
 
         See :meth:`read` and :meth:`read_control`; also
-        :meth:`make_raw_request`, :meth:`parse_textual_response`, and
-        :meth:`parse_numeric_response`; also :meth:`request_terminal_identity`,
-        :meth:`request_cursor_position`, :meth:`request_batch_mode`,
-        :meth:`request_ansi_color`, :meth:`request_dynamic_color`, and
-        :meth:`request_theme`.
+        :meth:`make_raw_request`, :meth:`make_raw_requests`,
+        :meth:`parse_textual_response`, and :meth:`parse_numeric_response`;
+        also :meth:`request_terminal_identity`, :meth:`request_cursor_position`,
+        :meth:`request_batch_mode`, :meth:`request_ansi_color`,
+        :meth:`request_dynamic_color`, and :meth:`request_theme`.
 
     **Scoped changes of terminal state**
         To more easily update, restore, and flush terminal states, ``Terminal``
@@ -386,6 +499,15 @@ class Terminal:
 
         self._input = cast(TextIO, input or sys.__stdin__)
         self._input_fileno = self._input.fileno()
+        self._pending = bytearray()
+        self._cbreak_known = False
+
+        # Register input with poll() once. On macOS, poll() does not support
+        # character devices such as TTYs, so keep using select() there.
+        self._poll: None | select.poll = None
+        if sys.platform != 'darwin' and hasattr(select, 'poll'):
+            self._poll = select.poll()
+            self._poll.register(self._input_fileno, select.POLLIN)
         self._output = cast(TextIO, output or sys.__stdout__)
         self._all_tty = self._input.isatty() and self._output.isatty()
 
@@ -482,8 +604,7 @@ class Terminal:
         # suffices to check for cbreak's minimal settings, since we want the
         # terminal to respond right away and not stuck in line-buffer mode.
         return (
-            not (mode[TerminalModeComponent.LFLAG] & termios.ECHO)
-            and not (mode[TerminalModeComponent.LFLAG] & termios.ICANON)
+            not (mode[TerminalModeComponent.LFLAG] & _CBREAK_LFLAGS)
             and mode[TerminalModeComponent.CC][termios.VMIN] == 1
             and mode[TerminalModeComponent.CC][termios.VTIME] == 0
         )
@@ -491,9 +612,10 @@ class Terminal:
     def check_cbreak_mode(self) -> Self:
         """
         Check that cbreak mode is enabled. THis method signals an exception if
-        cbreak mode is not enabled.
+        cbreak mode is not enabled. Inside a :meth:`cbreak_mode` context, this
+        method trusts the context and does not query the terminal mode.
         """
-        if not self.is_cbreak_mode():
+        if not self._cbreak_known and not self.is_cbreak_mode():
             raise ValueError('terminal is expected to be in cbreak mode but is not')
         return self
 
@@ -504,9 +626,9 @@ class Terminal:
         If the terminal is not yet in cbreak mode, the context manager sets
         cbreak mode upon entry and restores the previous mode upon exit. If the
         terminal is in cbreak mode already, the context manager does not modify
-        the terminal mode, but it still restores the previous mode upon exit.
-        Mode changes only take effect after all queued output has been written
-        but queued input is discarded.
+        the terminal mode, neither upon entry nor upon exit. Mode changes only
+        take effect after all queued output has been written but queued input is
+        discarded.
         """
         return TerminalContextManager(self).cbreak_mode()
 
@@ -604,83 +726,79 @@ class Terminal:
         ``timeout`` is 0, this method does *not* wait for input and immediately
         returns, possibly with an empty byte string. If the ``timeout`` is
         greater than 0, this method does wait for input, up to as many seconds,
-        using ``select()``.
+        using ``poll()`` or, on macOS, ``select()``. Bytes that
+        :meth:`read_control` read ahead but did not consume are returned first.
 
         This terminal must be in cbreak mode.
         """
         self.check_cbreak_mode()
-        if timeout > 0:
-            ready, _, _ = select.select([self._input_fileno], [], [], timeout)
-            if not ready:
-                raise TimeoutError()
+        if self._pending:
+            data = bytes(self._pending[:length])
+            del self._pending[:length]
+            return data
+        if timeout > 0 and not self._await_input(timeout):
+            raise TimeoutError()
         return os.read(self._input_fileno, length)
 
+    def _await_input(self, timeout: float) -> bool:
+        # Wait up to timeout seconds for input; return whether it is available.
+        if self._poll is None:
+            ready, _, _ = select.select([self._input_fileno], [], [], timeout)
+            return bool(ready)
+        return bool(self._poll.poll(timeout * 1000))
+
     ESCAPE_TIMEOUT: ClassVar[float] = 0.5
+    ESCAPE_READ_LENGTH: ClassVar[int] = 64
+
+    def _read_ahead(self) -> None:
+        # Append up to ESCAPE_READ_LENGTH bytes to the pending input.
+        if not self._await_input(self.ESCAPE_TIMEOUT):
+            raise TimeoutError()
+        data = os.read(self._input_fileno, self.ESCAPE_READ_LENGTH)
+        if not data:
+            raise EOFError()
+        self._pending.extend(data)
 
     def read_control(self) -> bytes:
         """
         Read a complete ANSI escape sequence from this terminal.
 
         This method implements a reasonable but not entirely complete state
-        machine for parsing ANSI escape sequences and keeps calling ``read()``
-        for more bytes as necessary. It uses ``ESCAPE_TIMEOUT`` as timeout.
+        machine for parsing ANSI escape sequences. Instead of reading one byte
+        at a time, it reads up to ``ESCAPE_READ_LENGTH`` bytes at a time into a
+        buffer and parses the buffered bytes, scanning the payload of
+        DCS/SOS/OSC/PM/APC sequences for the terminator in bulk. It uses
+        ``ESCAPE_TIMEOUT`` as timeout for each read and retains any bytes past
+        the end of the control sequence for the next read. If a read times out,
+        it discards the incomplete sequence before raising ``TimeoutError``.
+        Once the final byte has been scanned, this method returns without
+        waiting any further.
 
         The terminal must have TTYs for input and output. It also must be in
         cbreak mode.
         """
         self.check_tty().check_cbreak_mode()
-        buffer = bytearray()
-
-        def next_byte() -> int:
-            b = self.read(length=1, timeout=self.ESCAPE_TIMEOUT)[0]
-            buffer.append(b)
-            return b
-
-        def bad_byte(b: int) -> Never:
-            raise ValueError(f"unexpected key code 0x{b:02X}")
-
-        # TODO: Support ESC, CAN, SUB for cancellation
-
-        b = next_byte()
-        if b != 0x1B:
-            bad_byte(b)
-
-        # CSI Control Sequence
-        # --------------------
-
-        b = next_byte()
-        if b == 0x5B:  # [
-            b = next_byte()
-            while 0x30 <= b <= 0x3F:
-                b = next_byte()
-            while 0x20 <= b <= 0x2F:
-                b = next_byte()
-            if 0x40 <= b <= 0x7E:
-                return bytes(buffer)
-            bad_byte(b)
-
-        # DCS/SOS/OSC/PM/APC Control Sequence (Ending in ST)
-        # --------------------------------------------------
-
-        if b in (0x50, 0x58, 0x5D, 0x5E, 0x5F):  # P,X,],^,_
-            b = next_byte()
-            while b not in (0x07, 0x1B):
-                b = next_byte()
-            if b == 0x07:
-                return bytes(buffer)
-            b = next_byte()
-            if b == 0x5C:  # \\
-                return bytes(buffer)
-            bad_byte(b)
-
-        # Escape Sequence
-        # ---------------
-
-        while 0x20 <= b <= 0x2F:
-            b = next_byte()
-        if 0x30 <= b <= 0x7E:
-            return bytes(buffer)
-        bad_byte(b)
+        pending = self._pending
+        scanned = 0
+
+        try:
+            while (length := _scan_control(pending, scanned)) == 0:
+                # The last byte may be the ESC starting ST, so scan it again.
+                scanned = len(pending) - 1
+                self._read_ahead()
+        except TimeoutError:
+            # Drop the partial sequence, so that it doesn't corrupt the next read.
+            del pending[:]
+            raise
+
+        # Consume the bytes scanned, whether the sequence is well-formed or not
+        end = abs(length)
+        response = bytes(pending[:end])
+        del pending[:end]
+
+        if length < 0:
+            raise ValueError(f"unexpected key code 0x{response[-1]:02X}")
+        return response
 
     # ----------------------------------------------------------------------------------
 
@@ -693,17 +811,40 @@ class Terminal:
         The terminal must have TTYs for input and output. It also must be in
         cbreak mode.
         """
+        return self.make_raw_requests([query])[0]
+
+    def make_raw_requests(
+        self,
+        queries: Sequence[Sequence[None | int | str]],
+    ) -> list[None | bytes]:
+        """
+        Make several requests to this terminal in a single round trip. This
+        method writes all queries as ANSI escape sequences directly to the
+        output's file descriptor, bypassing the text layer, and then reads one
+        ANSI escape sequence per query as the responses. Once a response times
+        out, this method stops reading and fills in ``None`` for that and all
+        remaining responses.
+
+        The terminal must have TTYs for input and output. It also must be in
+        cbreak mode.
+        """
+        self.check_tty().check_output_tty().check_cbreak_mode()
+
+        # Since output is a TTY, write all queries with as few system calls as
+        # possible, after flushing whatever already is in the text layer.
+        self._output.flush()
+        fileno = self._output.fileno()
+        data = memoryview(''.join(Ansi.fuse(*query) for query in queries).encode())
+        while data:
+            data = data[os.write(fileno, data):]
+
+        responses: list[None | bytes] = []
         try:
-            return (
-                self
-                .check_tty()
-                .check_cbreak_mode()
-                .write_control(*query)
-                .flush()
-                .read_control()
-            )
+            for _ in range(len(queries)):
+                responses.append(self.read_control())
         except TimeoutError:
-            return None
+            responses.extend([None] * (len(queries) - len(responses)))
+        return responses
 
     def parse_textual_response(
         self,
@@ -926,22 +1067,25 @@ class Terminal:
     def _parse_color(
         self,
         index: int,
-        name: str,
         response: None | bytes,
     ) -> Color:
+        name = _COLOR_NAMES[index]
         if response is None:
             raise ValueError(f"no response to request for {name}'s color")
 
-        if index <= 1:
-            prefix = f'{Ansi.OSC}{10 + index};'
+        # The prefix includes the "rgb:" of the color, so one test covers both.
+        prefix = _COLOR_PREFIXES[index]
+        if response.endswith(RawAnsi.ST):
+            end = -2
+        elif response.endswith(RawAnsi.BEL):
+            end = -1
         else:
-            prefix = f'{Ansi.OSC}4;{index - 2};'
-
-        r = self.parse_textual_response(response, prefix=prefix, suffix=Ansi.ST)
-        if r is None or not r.startswith('rgb:'):
+            end = 0
+        if end == 0 or not response.startswith(prefix):
             raise ValueError(f"malformed response for {name}'s color")
 
-        return Color.parse(r)
+        # Color.parse() still needs the "rgb:", so slice from there.
+        return Color.parse(response[len(prefix) - 4:end].decode('utf8'))
 
     def request_ansi_color(self, color: int) -> Color:
         """
@@ -956,8 +1100,7 @@ class Terminal:
 
         return self._parse_color(
             color + 2,
-            ThemeEntry.from_index(color + 2).name(),
-            self.make_raw_request(Ansi.OSC, 4, color, ';?', Ansi.ST)
+            self.make_raw_request(_COLOR_QUERIES[color + 2]),
         )
 
     def request_dynamic_color(self, code: int) -> Color:
@@ -978,8 +1121,7 @@ class Terminal:
 
         return self._parse_color(
             code - 10,
-            ThemeEntry.from_index(code - 10).name(),
-            self.make_raw_request(Ansi.OSC, code, ';?', Ansi.ST),
+            self.make_raw_request(_COLOR_QUERIES[code - 10]),
         )
 
     def _request_theme_v1(self) -> Theme:
@@ -999,19 +1141,11 @@ class Terminal:
 
         self.check_tty().check_cbreak_mode()
 
-        for code in range(10, 12):
-            self.write_control(Ansi.OSC, code, ';?', Ansi.ST)
-        for color in range(16):
-            self.write_control(Ansi.OSC, 4, color, ';?', Ansi.ST)
-        self.flush()
+        self.write_control(_THEME_QUERY).flush()
 
         for index in range(18):
             response = self.read_control()
-            colors.append(self._parse_color(
-                index,
-                ThemeEntry.from_index(index).name(),
-                response,
-            ))
+            colors.append(self._parse_color(index, response))
 
         return Theme(colors)
 
@@ -1019,24 +1153,10 @@ class Terminal:
         # (1) Write all requests. (2) Read all responses. (3) Parse all responses.
         colors: list[Color] = []
 
-        self.check_tty().check_cbreak_mode()
-
-        for code in range(10, 12):
-            self.write_control(Ansi.OSC, code, ';?', Ansi.ST)
-        for color in range(16):
-            self.write_control(Ansi.OSC, 4, color, ';?', Ansi.ST)
-        self.flush()
-
-        responses: list[None | bytes] = []
-        for _ in range(18):
-            responses.append(self.read_control())
+        responses = self.make_raw_requests(_THEME_REQUESTS)
 
         for index, response in enumerate(responses):
-            colors.append(self._parse_color(
-                index,
-                ThemeEntry.from_index(index).name(),
-                response,
-            ))
+            colors.append(self._parse_color(index, response))
 
         return Theme(colors)
 
@@ -5,73 +5,74 @@ to meaningful color values.
 
 from collections.abc import Iterator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import ContextManager, overload
 
 from .color import Color, Sampler, OkVersion, Theme
 
 MACOS_TERMINAL = Theme([
-    Color.parse("#000000"),
-    Color.parse("#ffffff"),
-    Color.parse("#000000"),
-    Color.parse("#990000"),
-    Color.parse("#00a600"),
-    Color.parse("#999900"),
-    Color.parse("#0000b2"),
-    Color.parse("#b200b2"),
-    Color.parse("#00a6b2"),
-    Color.parse("#bfbfbf"),
-    Color.parse("#666666"),
-    Color.parse("#e50000"),
-    Color.parse("#00d900"),
-    Color.parse("#e5e500"),
-    Color.parse("#0000ff"),
-    Color.parse("#e500e5"),
-    Color.parse("#00e5e5"),
-    Color.parse("#e5e5e5"),
+    Color.from_24bit(0x00, 0x00, 0x00),
+    Color.from_24bit(0xff, 0xff, 0xff),
+    Color.from_24bit(0x00, 0x00, 0x00),
+    Color.from_24bit(0x99, 0x00, 0x00),
+    Color.from_24bit(0x00, 0xa6, 0x00),
+    Color.from_24bit(0x99, 0x99, 0x00),
+    Color.from_24bit(0x00, 0x00, 0xb2),
+    Color.from_24bit(0xb2, 0x00, 0xb2),
+    Color.from_24bit(0x00, 0xa6, 0xb2),
+    Color.from_24bit(0xbf, 0xbf, 0xbf),
+    Color.from_24bit(0x66, 0x66, 0x66),
+    Color.from_24bit(0xe5, 0x00, 0x00),
+    Color.from_24bit(0x00, 0xd9, 0x00),
+    Color.from_24bit(0xe5, 0xe5, 0x00),
+    Color.from_24bit(0x00, 0x00, 0xff),
+    Color.from_24bit(0xe5, 0x00, 0xe5),
+    Color.from_24bit(0x00, 0xe5, 0xe5),
+    Color.from_24bit(0xe5, 0xe5, 0xe5),
 ])
 
 
 VGA = Theme([
-    Color.parse("#000000"),
-    Color.parse("#ffffff"),
-    Color.parse("#000000"),
-    Color.parse("#aa0000"),
-    Color.parse("#00aa00"),
-    Color.parse("#aa5500"),
-    Color.parse("#0000aa"),
-    Color.parse("#aa00aa"),
-    Color.parse("#00aaaa"),
-    Color.parse("#aaaaaa"),
-    Color.parse("#555555"),
-    Color.parse("#ff5555"),
-    Color.parse("#55ff55"),
-    Color.parse("#ffff55"),
-    Color.parse("#5555ff"),
-    Color.parse("#ff55ff"),
-    Color.parse("#55ffff"),
-    Color.parse("#ffffff"),
+    Color.from_24bit(0x00, 0x00, 0x00),
+    Color.from_24bit(0xff, 0xff, 0xff),
+    Color.from_24bit(0x00, 0x00, 0x00),
+    Color.from_24bit(0xaa, 0x00, 0x00),
+    Color.from_24bit(0x00, 0xaa, 0x00),
+    Color.from_24bit(0xaa, 0x55, 0x00),
+    Color.from_24bit(0x00, 0x00, 0xaa),
+    Color.from_24bit(0xaa, 0x00, 0xaa),
+    Color.from_24bit(0x00, 0xaa, 0xaa),
+    Color.from_24bit(0xaa, 0xaa, 0xaa),
+    Color.from_24bit(0x55, 0x55, 0x55),
+    Color.from_24bit(0xff, 0x55, 0x55),
+    Color.from_24bit(0x55, 0xff, 0x55),
+    Color.from_24bit(0xff, 0xff, 0x55),
+    Color.from_24bit(0x55, 0x55, 0xff),
+    Color.from_24bit(0xff, 0x55, 0xff),
+    Color.from_24bit(0x55, 0xff, 0xff),
+    Color.from_24bit(0xff, 0xff, 0xff),
 ])
 
 
 XTERM = Theme([
-    Color.parse("#000000"),
-    Color.parse("#ffffff"),
-    Color.parse("#000000"),
-    Color.parse("#cd0000"),
-    Color.parse("#00cd00"),
-    Color.parse("#cdcd00"),
-    Color.parse("#0000ee"),
-    Color.parse("#cd00cd"),
-    Color.parse("#00cdcd"),
-    Color.parse("#e5e5e5"),
-    Color.parse("#7f7f7f"),
-    Color.parse("#ff0000"),
-    Color.parse("#00ff00"),
-    Color.parse("#ffff00"),
-    Color.parse("#5c5cff"),
-    Color.parse("#ff00ff"),
-    Color.parse("#00ffff"),
-    Color.parse("#ffffff"),
+    Color.from_24bit(0x00, 0x00, 0x00),
+    Color.from_24bit(0xff, 0xff, 0xff),
+    Color.from_24bit(0x00, 0x00, 0x00),
+    Color.from_24bit(0xcd, 0x00, 0x00),
+    Color.from_24bit(0x00, 0xcd, 0x00),
+    Color.from_24bit(0xcd, 0xcd, 0x00),
+    Color.from_24bit(0x00, 0x00, 0xee),
+    Color.from_24bit(0xcd, 0x00, 0xcd),
+    Color.from_24bit(0x00, 0xcd, 0xcd),
+    Color.from_24bit(0xe5, 0xe5, 0xe5),
+    Color.from_24bit(0x7f, 0x7f, 0x7f),
+    Color.from_24bit(0xff, 0x00, 0x00),
+    Color.from_24bit(0x00, 0xff, 0x00),
+    Color.from_24bit(0xff, 0xff, 0x00),
+    Color.from_24bit(0x5c, 0x5c, 0xff),
+    Color.from_24bit(0xff, 0x00, 0xff),
+    Color.from_24bit(0x00, 0xff, 0xff),
+    Color.from_24bit(0xff, 0xff, 0xff),
 ])
 
 
@@ -91,17 +92,19 @@ def builtin_theme_name(theme: Theme) -> None | str:
         return None
 
 
-_current_theme_and_sampler: list[tuple[Theme, Sampler]] = [
-    (VGA, Sampler(VGA, OkVersion.Revised))
-]
+# The current theme and sampler. A context variable keeps them a single lookup
+# away, while also giving each thread and asyncio task its own current theme.
+_current_theme_and_sampler: ContextVar[tuple[Theme, Sampler]] = ContextVar(
+    '_current_theme_and_sampler', default=(VGA, Sampler(VGA, OkVersion.Revised))
+)
 
 @contextmanager
 def _manage_theme_and_sampler(theme: Theme) -> Iterator[Theme]:
-    _current_theme_and_sampler.append((theme, Sampler(theme, OkVersion.Revised)))
+    token = _current_theme_and_sampler.set((theme, Sampler(theme, OkVersion.Revised)))
     try:
         yield theme
     finally:
-        _current_theme_and_sampler.pop()
+        _current_theme_and_sampler.reset(token)
 
 
 @overload
@@ -122,10 +125,12 @@ def current_theme(theme: None | Theme = None) -> Theme | ContextManager[Theme]:
         manager that switches to the provided theme on entry and restores the
         current theme again on exit.
 
-    The default theme uses the same colors as good ol' VGA text mode.
+    The default theme uses the same colors as good ol' VGA text mode. The
+    current theme is tracked per thread and per asyncio task, so switching
+    themes in one does not affect the others.
     """
     return (
-        _current_theme_and_sampler[-1][0]
+        _current_theme_and_sampler.get()[0]
         if theme is None
         else _manage_theme_and_sampler(theme)
     )
@@ -139,4 +144,4 @@ def current_sampler() -> Sampler:
     uses the revised version of Oklab, i.e., Oklrab, for measuring color
     differences.
     """
-    return _current_theme_and_sampler[-1][1]
+    return _current_theme_and_sampler.get()[1]
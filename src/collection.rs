@@ -606,10 +606,10 @@ impl Sampler {
     /// However, a production-ready version does need to account for lightness,
     /// too.
     pub fn to_closest_ansi(&self, color: &Color) -> AnsiColor {
-        use crate::core::{delta_e_ok, find_closest};
+        use crate::core::{delta_e_ok_squared, find_closest};
 
         let color = color.to(self.space);
-        find_closest(color.as_ref(), &self.ansi, delta_e_ok)
+        find_closest(color.as_ref(), &self.ansi, delta_e_ok_squared)
             .map(|idx| AnsiColor::try_from(idx as u8).unwrap())
             .unwrap()
     }
@@ -644,10 +644,10 @@ impl Sampler {
     /// This method does most of the heavy lifting for
     /// [`Sampler::to_closest_8bit`] but does not wrap the 8-bit index.
     pub fn to_closest_8bit_raw(&self, color: &Color) -> u8 {
-        use crate::core::{delta_e_ok, find_closest};
+        use crate::core::{delta_e_ok_squared, find_closest};
 
         let color = color.to(self.space);
-        find_closest(color.as_ref(), &self.eight_bit, delta_e_ok)
+        find_closest(color.as_ref(), &self.eight_bit, delta_e_ok_squared)
             .map(|idx| idx as u8 + 16)
             .unwrap()
     }
@@ -38,8 +38,17 @@ pub(crate) fn to_eq_bits(space: ColorSpace, coordinates: &[Float; 3]) -> [Bits;
 
 /// Compute Delta-E for Oklab or Oklrab.
 #[inline]
-#[allow(non_snake_case)]
 pub(crate) fn delta_e_ok(coordinates1: &[Float; 3], coordinates2: &[Float; 3]) -> Float {
+    delta_e_ok_squared(coordinates1, coordinates2).sqrt()
+}
+
+/// Compute the square of Delta-E for Oklab or Oklrab.
+///
+/// Since squaring preserves the order of non-negative numbers, this function
+/// suffices for finding the closest color, while avoiding the square root.
+#[inline]
+#[allow(non_snake_case)]
+pub(crate) fn delta_e_ok_squared(coordinates1: &[Float; 3], coordinates2: &[Float; 3]) -> Float {
     let [L1, a1, b1] = coordinates1;
     let [L2, a2, b2] = coordinates2;
 
@@ -47,7 +56,7 @@ pub(crate) fn delta_e_ok(coordinates1: &[Float; 3], coordinates2: &[Float; 3]) -
     let Δa = a1 - a2;
     let Δb = b1 - b2;
 
-    ΔL.mul_add(ΔL, Δa.mul_add(Δa, Δb * Δb)).sqrt()
+    ΔL.mul_add(ΔL, Δa.mul_add(Δa, Δb * Δb))
 }
 
 /// Find the candidate color closest to the origin.
@@ -14,7 +14,7 @@ pub(crate) use contrast::{
 pub(crate) use conversion::{convert, from_24bit, to_24bit};
 pub use difference::HueInterpolation;
 pub(crate) use difference::{
-    delta_e_ok, find_closest, interpolate, prepare_to_interpolate, to_eq_bits,
+    delta_e_ok, delta_e_ok_squared, find_closest, interpolate, prepare_to_interpolate, to_eq_bits,
 };
 pub(crate) use gamut::{clip, in_gamut, to_gamut};
 pub(crate) use space::normalize;
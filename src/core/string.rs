@@ -1,6 +1,7 @@
 #[cfg(feature = "pyffi")]
 use pyo3::{exceptions::PyValueError, prelude::*};
 
+use super::from_24bit;
 use crate::{ColorSpace, Float};
 
 /// An erroneous color format.
@@ -120,24 +121,31 @@ impl From<ColorFormatError> for PyErr {
 fn parse_hashed(s: &str) -> Result<[u8; 3], ColorFormatError> {
     if !s.starts_with('#') {
         return Err(ColorFormatError::UnknownFormat);
-    } else if s.len() != 4 && s.len() != 7 {
+    } else if (s.len() != 4 && s.len() != 7) || !s.is_ascii() {
         return Err(ColorFormatError::UnexpectedCharacters);
     }
 
-    fn parse_coordinate(s: &str, index: usize) -> Result<u8, ColorFormatError> {
-        let factor = s.len() / 3;
-        let t = s
-            .get(1 + factor * index..1 + factor * (index + 1))
-            .ok_or(ColorFormatError::UnexpectedCharacters)?;
-        let n = u8::from_str_radix(t, 16).map_err(|_| ColorFormatError::MalformedHex)?;
+    // Convert digits directly from bytes, without slicing substrings.
+    fn digit(byte: u8) -> Result<u8, ColorFormatError> {
+        (byte as char)
+            .to_digit(16)
+            .map(|d| d as u8)
+            .ok_or(ColorFormatError::MalformedHex)
+    }
 
-        Ok(if factor == 1 { 16 * n + n } else { n })
+    let digits = &s.as_bytes()[1..];
+    let mut coordinates = [0_u8; 3];
+    if digits.len() == 3 {
+        for (coordinate, &byte) in coordinates.iter_mut().zip(digits) {
+            *coordinate = 17 * digit(byte)?;
+        }
+    } else {
+        for (coordinate, pair) in coordinates.iter_mut().zip(digits.chunks_exact(2)) {
+            *coordinate = 16 * digit(pair[0])? + digit(pair[1])?;
+        }
     }
 
-    let c1 = parse_coordinate(s, 0)?;
-    let c2 = parse_coordinate(s, 1)?;
-    let c3 = parse_coordinate(s, 2)?;
-    Ok([c1, c2, c3])
+    Ok(coordinates)
 }
 
 // --------------------------------------------------------------------------------------------------------------------
@@ -146,32 +154,41 @@ fn parse_hashed(s: &str) -> Result<[u8; 3], ColorFormatError> {
 /// three pairs with the number of hexadecimal digits and the numeric value for
 /// each coordinate.
 fn parse_x(s: &str) -> Result<[(u8, u16); 3], ColorFormatError> {
-    if !s.starts_with("rgb:") {
-        return Err(ColorFormatError::UnknownFormat);
-    }
+    let body = s
+        .strip_prefix("rgb:")
+        .ok_or(ColorFormatError::UnknownFormat)?;
 
-    fn parse_coordinate(s: Option<&str>, _: usize) -> Result<(u8, u16), ColorFormatError> {
-        let t = s.ok_or(ColorFormatError::MissingCoordinate)?;
-        if t.is_empty() {
-            return Err(ColorFormatError::MissingCoordinate);
-        } else if t.len() > 4 {
-            return Err(ColorFormatError::OversizedCoordinate);
+    // Accumulate digits in a single pass over the bytes, without splitting.
+    let mut coordinates = [(0_u8, 0_u16); 3];
+    let mut index = 0;
+    for byte in body.bytes() {
+        if byte == b'/' {
+            if coordinates[index].0 == 0 {
+                return Err(ColorFormatError::MissingCoordinate);
+            }
+            index += 1;
+            if index == 3 {
+                return Err(ColorFormatError::TooManyCoordinates);
+            }
+            continue;
         }
 
-        let n = u16::from_str_radix(t, 16).map_err(|_| ColorFormatError::MalformedHex)?;
-        Ok((t.len() as u8, n))
+        let digit = (byte as char)
+            .to_digit(16)
+            .ok_or(ColorFormatError::MalformedHex)?;
+        let (length, value) = &mut coordinates[index];
+        if *length == 4 {
+            return Err(ColorFormatError::OversizedCoordinate);
+        }
+        *length += 1;
+        *value = (*value << 4) | digit as u16;
     }
 
-    // SAFETY: unwrap() is safe because we tested for just that prefix above.
-    let mut iter = s.strip_prefix("rgb:").unwrap().split('/');
-    let c1 = parse_coordinate(iter.next(), 0)?;
-    let c2 = parse_coordinate(iter.next(), 1)?;
-    let c3 = parse_coordinate(iter.next(), 2)?;
-    if iter.next().is_some() {
-        return Err(ColorFormatError::TooManyCoordinates);
+    if index < 2 || coordinates[2].0 == 0 {
+        return Err(ColorFormatError::MissingCoordinate);
     }
 
-    Ok([c1, c2, c3])
+    Ok(coordinates)
 }
 
 const COLOR_SPACES: [(&str, ColorSpace); 10] = [
@@ -261,17 +278,13 @@ pub(crate) fn parse(s: &str) -> Result<(ColorSpace, [Float; 3]), ColorFormatErro
 
     if s.starts_with('#') {
         let [c1, c2, c3] = parse_hashed(s)?;
-        Ok((
-            ColorSpace::Srgb,
-            [
-                c1 as Float / 255.0,
-                c2 as Float / 255.0,
-                c3 as Float / 255.0,
-            ],
-        ))
+        Ok((ColorSpace::Srgb, from_24bit(c1, c2, c3)))
     } else if s.starts_with("rgb:") {
+        // 16^n - 1 for coordinates with n = 1..=4 hex digits
+        const DIVISORS: [Float; 4] = [15.0, 255.0, 4095.0, 65535.0];
+
         fn scale(len_and_value: (u8, u16)) -> Float {
-            len_and_value.1 as Float / (16_i32.pow(len_and_value.0 as u32) - 1) as Float
+            len_and_value.1 as Float / DIVISORS[len_and_value.0 as usize - 1]
         }
 
         let [c1, c2, c3] = parse_x(s)?;
@@ -375,6 +388,9 @@ mod test {
         let result = parse_hashed("#00g");
         assert!(matches!(result, Err(ColorFormatError::MalformedHex)));
 
+        let result = parse_hashed("#+f+f+f");
+        assert!(matches!(result, Err(ColorFormatError::MalformedHex)));
+
         Ok(())
     }
 
@@ -406,8 +422,19 @@ mod test {
             Err(ColorFormatError::TooManyCoordinates)
         );
 
+        assert_eq!(
+            parse_x("rgb:1/2/3/"),
+            Err(ColorFormatError::TooManyCoordinates)
+        );
+        assert_eq!(
+            parse_x("rgb:1/2/"),
+            Err(ColorFormatError::MissingCoordinate)
+        );
+
         let result = parse_x("rgb:f/g/f");
         assert!(matches!(result, Err(ColorFormatError::MalformedHex)));
+        let result = parse_x("rgb:+f/f/f");
+        assert!(matches!(result, Err(ColorFormatError::MalformedHex)));
 
         assert_eq!(
             parse("   RGB:00/55/aa   ")?,
@@ -416,6 +443,7 @@ mod test {
                 [0.0 as Float, 0.33333333333333333, 0.6666666666666666]
             )
         );
+        assert_eq!(parse("rgb:f/fff/ffff")?, (Srgb, [1.0 as Float, 1.0, 1.0]));
 
         Ok(())
     }
@@ -2,9 +2,10 @@
 use pyo3::prelude::*;
 
 use crate::core::{
-    clip, convert, delta_e_ok, format, from_24bit, in_gamut, interpolate, normalize, parse,
-    prepare_to_interpolate, scale_lightness, to_24bit, to_contrast, to_contrast_luminance_p3,
-    to_contrast_luminance_srgb, to_eq_bits, to_gamut, ColorSpace, HueInterpolation,
+    clip, convert, delta_e_ok, delta_e_ok_squared, format, from_24bit, in_gamut, interpolate,
+    normalize, parse, prepare_to_interpolate, scale_lightness, to_24bit, to_contrast,
+    to_contrast_luminance_p3, to_contrast_luminance_srgb, to_eq_bits, to_gamut, ColorSpace,
+    HueInterpolation,
 };
 
 #[cfg(feature = "pyffi")]
@@ -974,7 +975,8 @@ impl Color {
     /// <span class=rust-only></span>
     ///
     /// This method delegates to [`Color::find_closest`] using the Delta E
-    /// metric for Oklab/Oklrab, which is the Euclidian distance.
+    /// metric for Oklab/Oklrab, which is the Euclidian distance. Since only
+    /// the order of distances matters, it compares squared distances.
     ///
     /// Since this method converts every color to either Oklab or Oklrab, it
     /// also normalizes every color before use.
@@ -1012,7 +1014,7 @@ impl Color {
     where
         C: IntoIterator<Item = &'c Self>,
     {
-        self.find_closest(candidates, version.cartesian_space(), delta_e_ok)
+        self.find_closest(candidates, version.cartesian_space(), delta_e_ok_squared)
     }
 
     /// Find the index position of the candidate color closest to this color.
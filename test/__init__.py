@@ -1 +1,2 @@
 from .test_color import TestColor # type: ignore
+from .test_terminal import TestTerminal # type: ignore
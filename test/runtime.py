@@ -12,11 +12,12 @@ hidden in the `testunit` adapter.
 """
 
 import dataclasses
+import functools
 import inspect
 import json
 import os
 from types import TracebackType
-from typing import Any, Callable, TextIO, TypeAlias, TYPE_CHECKING
+from typing import Callable, TextIO, TypeAlias
 import unittest
 
 
@@ -38,6 +39,12 @@ SYMBOLS = ASCII_SYMBOLS if os.name == 'nt' else UNICODE_SYMBOLS
 # --------------------------------------------------------------------------------------
 
 
+@functools.cache
+def _source_file(cls: type[unittest.TestCase]) -> None | str:
+    # inspect.getsourcefile() consults the file system, so only ask once per class.
+    return inspect.getsourcefile(cls)
+
+
 ExcInfo: TypeAlias = tuple[type[BaseException], BaseException, TracebackType]
 OptExcInfo: TypeAlias = ExcInfo | tuple[None, None, None]
 
@@ -47,14 +54,34 @@ class testunit:
     """Adapter for making instances of `unittest.TestCase` usable."""
 
     testcase: unittest.TestCase
-
-    @property
-    def is_subtest(self) -> bool:
-        return self.testcase.__class__.__name__ == "_SubTest"
-
-    @property
-    def base(self) -> unittest.TestCase:
-        return getattr(self.testcase, "test_case", self.testcase)
+    is_subtest: bool = dataclasses.field(init=False, repr=False, compare=False)
+    base: unittest.TestCase = dataclasses.field(init=False, repr=False, compare=False)
+    method: str = dataclasses.field(init=False, repr=False, compare=False)
+    # The message for subtests and an empty string otherwise.
+    message: str = dataclasses.field(init=False, repr=False, compare=False)
+    # The parameters for subtests and an empty dictionary otherwise.
+    params: dict[str, object] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    failure_exception: type[BaseException] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Reporting accesses these attributes repeatedly, so determine them
+        # once. Since the dataclass is frozen, that requires object.__setattr__.
+        testcase = self.testcase
+        base = getattr(testcase, "test_case", testcase)
+        msg = getattr(testcase, "_message", "")
+
+        object.__setattr__(self, "is_subtest", testcase.__class__.__name__ == "_SubTest")
+        object.__setattr__(self, "base", base)
+        object.__setattr__(self, "method", base._testMethodName)
+        # Sigh, `_message` may have `_subtest_msg_sentinel` as value, which is
+        # an arbitrary object. Avoid accessing more private state like so:
+        object.__setattr__(self, "message", msg if isinstance(msg, str) else "")
+        object.__setattr__(self, "params", getattr(testcase, "params", {}))
+        object.__setattr__(self, "failure_exception", testcase.failureException)
 
     @property
     def module(self) -> str:
@@ -62,24 +89,7 @@ class testunit:
 
     @property
     def source_file(self) -> None | str:
-        return inspect.getsourcefile(self.base.__class__)
-
-    @property
-    def method(self) -> str:
-        return self.base._testMethodName
-
-    @property
-    def message(self) -> str:
-        """Get the message for subtests and an empty string otherwise."""
-        msg = getattr(self.testcase, "_message", "")
-        # Sigh, `_message` may have `_subtest_msg_sentinel` as value, which is
-        # an arbitrary object. Avoid accessing more private state like so:
-        return msg if isinstance(msg, str) else ""
-
-    @property
-    def params(self) -> dict[str, object]:
-        """Get the parameters for subtests and empty dictionary otherwise."""
-        return getattr(self.testcase, "params", {})
+        return _source_file(self.base.__class__)
 
     @property
     def invocation(self) -> str:
@@ -87,15 +97,11 @@ class testunit:
         Format a stylized method invocation suitable as human-readable
         identifier for the specific test case, which may be a subtest.
         """
-        try:
-            message = json.dumps(self.message) if self.message else ""
-        except:
-            print("***", self.message)
-            message = ""
-        params = ", ".join(f"{k}={v}" for k, v in self.params.items())
-        between = f"{message}, {params}" if message and params else message + params
-        if self.is_subtest and not between:
-            between = "<subtest>"
+        # Since message is guaranteed to be a string, json.dumps() cannot fail.
+        message = self.message
+        parts = [json.dumps(message)] if message else []
+        parts.extend(f"{k}={v}" for k, v in self.params.items())
+        between = ", ".join(parts) or ("<subtest>" if self.is_subtest else "")
         return f"{self.method}({between})"
 
     def is_success(self, err: None | OptExcInfo) -> bool:
@@ -105,21 +111,40 @@ class testunit:
         return (
             err is not None
             and err[0] is not None
-            and issubclass(err[0], self.testcase.failureException)
+            and issubclass(err[0], self.failure_exception)
         )
 
 
 TIGHT_WIDTH = 70
 
 
+def _terminal_width() -> int:
+    try:
+        return os.get_terminal_size().columns
+    except OSError:
+        return 80
+
+
+# Probe the terminal size once, not for every styled stream.
+TERMINAL_WIDTH = _terminal_width()
+
+
 class StyledStream:
     def __init__(self, stream: TextIO) -> None:
         self.stream = stream
         self.isatty = stream.isatty()
-        try:
-            self.width = os.get_terminal_size().columns
-        except:
-            self.width = 80
+        self.width = TERMINAL_WIDTH
+
+        # Styling only applies to terminals. So decide once whether it does.
+        self.sgr: Callable[[str, str], str]
+        self.pad: Callable[[str], str]
+        if self.isatty:
+            tight_width = self.tight_width
+            self.sgr = lambda ps, text: f"\x1b[{ps}m{text}\x1b[0m"
+            self.pad = lambda text: text.ljust(tight_width)
+        else:
+            self.sgr = lambda _, text: text
+            self.pad = lambda text: text
 
     @property
     def tight_width(self) -> int:
@@ -138,12 +163,6 @@ class StyledStream:
     def h2(self, text: str) -> str:
         return self._hn(SYMBOLS.h2, len(text), text)
 
-    def sgr(self, ps: str, text: str) -> str:
-        return f"\x1b[{ps}m{text}\x1b[0m" if self.isatty else text
-
-    def pad(self, text: str) -> str:
-        return text.ljust(self.tight_width) if self.isatty else text
-
     def heading(self, text: str) -> str:
         return self.sgr("1;48;5;153", text)
 
@@ -171,11 +190,15 @@ ProgressTracker: TypeAlias = Callable[[testunit, None | OptExcInfo], None]
 ResultPrinter: TypeAlias = Callable[[int, list[BrokenTest], list[BrokenTest]], None]
 
 
+PROGRESS_BATCH = 16
+
+
 def track_progress(stream: TextIO) -> ProgressTracker:
     columns = 0
+    pending = 0
 
     def track_progress(test: testunit, err: None | OptExcInfo) -> None:
-        nonlocal columns
+        nonlocal columns, pending
 
         if test.is_success(err):
             stream.write(SYMBOLS.dot1 if test.is_subtest else SYMBOLS.dot0)
@@ -184,12 +207,19 @@ def track_progress(stream: TextIO) -> ProgressTracker:
         else:
             stream.write("e" if test.is_subtest else "E")
 
+        # Flush only at the end of a line or after a batch of marks, since
+        # flushing for every (sub)test is one write(2) each. print_summary()
+        # flushes whatever marks remain.
         columns += 1
+        pending += 1
         if columns >= TIGHT_WIDTH:
             stream.write("\n")
             columns = 0
+        elif pending < PROGRESS_BATCH:
+            return
 
         stream.flush()
+        pending = 0
 
     return track_progress
 
@@ -228,39 +258,36 @@ def print_summary(stream: TextIO) -> ResultPrinter:
     return print_summary
 
 
-class ResultAdapter(unittest.TestResult if TYPE_CHECKING else object):
+class ResultAdapter(unittest.TestResult):
+    """
+    A test result that tracks progress and prints a summary in its own style.
+
+    By extending `unittest.TestResult` instead of wrapping an instance, all
+    of unittest's own accesses to the result's state resolve directly, and
+    only the methods updating progress need overriding.
+    """
     def __init__(
         self,
         stream: TextIO,
         descriptions: bool,
         verbosity: int,
         *,
-        result: None | unittest.TestResult = None,
         tracker: None | ProgressTracker = None,
         printer: None | ResultPrinter = None,
     ) -> None:
+        super().__init__(stream, descriptions, verbosity)
         self._stream = stream
         self._test_count = 0
         self._subtest_count = 0
-        self._result = (
-            unittest.TestResult(stream, descriptions, verbosity)
-            if result is None
-            else result
-        )
         self._tracker = track_progress(stream) if tracker is None else tracker
         self._printer = print_summary(stream) if printer is None else printer
 
-    def __getattr__(self, name: str) -> Any:
-        if name.startswith("_") or not hasattr(self._result, name):
-            raise AttributeError(name)
-        return getattr(self._result, name)
-
     def startTest(self, test: unittest.case.TestCase) -> None:
-        self._result.startTest(test)
+        super().startTest(test)
         self._subtest_count = 0
 
     def stopTest(self, test: unittest.case.TestCase) -> None:
-        self._result.stopTest(test)
+        super().stopTest(test)
         self._test_count += 1 if self._subtest_count == 0 else self._subtest_count
 
     def addSubTest(
@@ -269,26 +296,26 @@ class ResultAdapter(unittest.TestResult if TYPE_CHECKING else object):
         subtest: unittest.TestCase,
         err: None | OptExcInfo,
     ) -> None:
-        self._result.addSubTest(test, subtest, err)
+        super().addSubTest(test, subtest, err)
         self._subtest_count += 1
         self._tracker(testunit(subtest), err)
 
     def addError(self, test: unittest.case.TestCase, err: OptExcInfo) -> None:
-        self._result.addError(test, err)
+        super().addError(test, err)
         self._tracker(testunit(test), err)
 
     def addFailure(self, test: unittest.case.TestCase, err: OptExcInfo) -> None:
-        self._result.addFailure(test, err)
+        super().addFailure(test, err)
         self._tracker(testunit(test), err)
 
     def addSuccess(self, test: unittest.case.TestCase) -> None:
-        self._result.addSuccess(test)
+        super().addSuccess(test)
         if self._subtest_count == 0:
             self._tracker(testunit(test), None)
 
     def printErrors(self) -> None:
         self._printer(
             self._test_count,
-            [(testunit(test), trace) for test, trace in self._result.failures],
-            [(testunit(test), trace) for test, trace in self._result.errors],
+            [(testunit(test), trace) for test, trace in self.failures],
+            [(testunit(test), trace) for test, trace in self.errors],
         )
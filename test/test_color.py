@@ -9,6 +9,12 @@ from prettypretty.theme import current_sampler
 
 class ColorValues:
 
+    __slots__ = (
+        'spec', '_parsed', 'srgb', 'linear_srgb', 'p3', 'linear_p3', 'xyz', 'oklab',
+        'oklch', '_ansi', 'black_text', 'black_background', 'closest_index', 'xterm',
+        'css',
+    )
+
     def __init__(
         self,
         spec: str,
@@ -28,7 +34,7 @@ class ColorValues:
         css: str,
     ) -> None:
         self.spec = spec
-        self.parsed = TrueColor(*parsed)
+        self._parsed = parsed
         self.srgb = Color(ColorSpace.Srgb, srgb)
         self.linear_srgb = Color(ColorSpace.LinearSrgb, linear_srgb)
         self.p3 = Color(ColorSpace.DisplayP3, p3)
@@ -36,13 +42,22 @@ class ColorValues:
         self.xyz = Color(ColorSpace.Xyz, xyz)
         self.oklab = Color(ColorSpace.Oklab, oklab)
         self.oklch = Color(ColorSpace.Oklch, oklch)
-        self.ansi = AnsiColor.from_8bit(ansi)
+        self._ansi = ansi
         self.black_text = black_text
         self.black_background = black_background
         self.closest_index = closest_index
         self.xterm = xterm
         self.css = css
 
+    # No test reads the terminal colors yet, so only create them on demand.
+    @property
+    def parsed(self) -> TrueColor:
+        return TrueColor(*self._parsed)
+
+    @property
+    def ansi(self) -> AnsiColor:
+        return AnsiColor.from_8bit(self._ansi)
+
     # spec: str
     # parsed: tuple[int, int, int]
     # srgb: tuple[float, float, float]
@@ -134,6 +149,8 @@ class TestColor(unittest.TestCase):
         css = 'rgb(255 255 255)',
     )
 
+    COLORS = (('black', BLACK), ('yellow', YELLOW), ('blue', BLUE), ('white', WHITE))
+
     def test_same_color(self) -> None:
         green = Color(ColorSpace.Srgb, (0.0, 1.0, 0.0))
         self.assertEqual(green.space(), ColorSpace.Srgb)
@@ -156,59 +173,50 @@ class TestColor(unittest.TestCase):
 
 
     def test_conversions(self) -> None:
-        for color_name in ('BLACK', 'YELLOW', 'BLUE', 'WHITE'):
-            values = getattr(self, color_name)
-            spec = values.spec
-
-            color_name = color_name.lower()
-            with self.subTest('hex-string to sRGB', color=color_name):
-                srgb = Color.parse(spec)
-                self.assertEqual(srgb, values.srgb)
-
-            with self.subTest('sRGB back to hex-string', color=color_name):
-                self.assertEqual(srgb.to_hex_format(), values.spec)
+        # One subtest per color, with each assertion naming its conversion.
+        for color_name, values in self.COLORS:
+            with self.subTest(color=color_name):
+                srgb = Color.parse(values.spec)
+                self.assertEqual(srgb, values.srgb, 'hex-string to sRGB')
+                self.assertEqual(
+                    srgb.to_hex_format(), values.spec, 'sRGB back to hex-string'
+                )
 
-            with self.subTest('sRGB to linear sRGB', color=color_name):
                 linear_srgb = srgb.to(ColorSpace.LinearSrgb)
-                self.assertEqual(linear_srgb, values.linear_srgb)
+                self.assertEqual(linear_srgb, values.linear_srgb, 'sRGB to linear sRGB')
+                self.assertEqual(
+                    linear_srgb.to(ColorSpace.Srgb), srgb, 'linear sRGB back to sRGB'
+                )
 
-            with self.subTest('linear sRGB back to sRGB', color=color_name):
-                self.assertEqual(linear_srgb.to(ColorSpace.Srgb), srgb)
-
-            with self.subTest('linear sRGB to XYZ', color=color_name):
                 xyz = linear_srgb.to(ColorSpace.Xyz)
-                self.assertEqual(xyz, values.xyz)
-
-            with self.subTest('XYZ back to linear sRGB', color=color_name):
-                self.assertEqual(xyz.to(ColorSpace.LinearSrgb), linear_srgb)
+                self.assertEqual(xyz, values.xyz, 'linear sRGB to XYZ')
+                self.assertEqual(
+                    xyz.to(ColorSpace.LinearSrgb),
+                    linear_srgb,
+                    'XYZ back to linear sRGB',
+                )
 
-            with self.subTest('XYZ to linear P3', color=color_name):
                 linear_p3 = xyz.to(ColorSpace.LinearDisplayP3)
-                self.assertEqual(linear_p3, values.linear_p3)
-
-            with self.subTest('linear P3 back to XYZ', color=color_name):
-                self.assertEqual(linear_p3.to(ColorSpace.Xyz), xyz)
+                self.assertEqual(linear_p3, values.linear_p3, 'XYZ to linear P3')
+                self.assertEqual(
+                    linear_p3.to(ColorSpace.Xyz), xyz, 'linear P3 back to XYZ'
+                )
 
-            with self.subTest('linear P3 to P3', color=color_name):
                 p3 = linear_p3.to(ColorSpace.DisplayP3)
-                self.assertEqual(p3, values.p3)
+                self.assertEqual(p3, values.p3, 'linear P3 to P3')
+                self.assertEqual(
+                    p3.to(ColorSpace.LinearDisplayP3), linear_p3, 'P3 back to linear P3'
+                )
 
-            with self.subTest('P3 back to linear P3', color=color_name):
-                self.assertEqual(p3.to(ColorSpace.LinearDisplayP3), linear_p3)
-
-            with self.subTest('XYZ to Oklab', color=color_name):
                 oklab = xyz.to(ColorSpace.Oklab)
-                self.assertEqual(oklab, values.oklab)
-
-            with self.subTest('Oklab back to XYZ', color=color_name):
-                self.assertEqual(oklab.to(ColorSpace.Xyz), xyz)
+                self.assertEqual(oklab, values.oklab, 'XYZ to Oklab')
+                self.assertEqual(oklab.to(ColorSpace.Xyz), xyz, 'Oklab back to XYZ')
 
-            with self.subTest('Oklab to Oklch', color=color_name):
                 oklch = oklab.to(ColorSpace.Oklch)
-                self.assertEqual(oklch, values.oklch)
-
-            with self.subTest('Oklch back to Oklab', color=color_name):
-                self.assertEqual(oklch.to(ColorSpace.Oklab), oklab)
+                self.assertEqual(oklch, values.oklch, 'Oklab to Oklch')
+                self.assertEqual(
+                    oklch.to(ColorSpace.Oklab), oklab, 'Oklch back to Oklab'
+                )
 
 
     def test_gamut_mapping(self) -> None:
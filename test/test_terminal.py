@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+
+# Terminal support depends on termios and tty, which are not available on Windows.
+if sys.platform != 'win32':
+    import pty
+    from prettypretty.terminal import Terminal
+    from prettypretty.terminal import _scan_control  # type: ignore[reportPrivateUsage]
+
+
+@unittest.skipIf(sys.platform == 'win32', 'terminal support requires termios')
+class TestTerminal(unittest.TestCase):
+
+    SEQUENCES = (
+        b'\x1b[A',
+        b'\x1b[12;3R',
+        b'\x1b[?2026;2$y',
+        b'\x1b]10;rgb:ff/00/80\x07',
+        b'\x1b]4;1;rgb:ff/00/80\x1b\\',
+        b'\x1bP>|xterm\x1b\\',
+        b'\x1b7',
+        b'\x1b(B',
+    )
+
+    def test_scan_complete(self) -> None:
+        for sequence in self.SEQUENCES:
+            with self.subTest(sequence=sequence):
+                data = bytearray(sequence)
+                self.assertEqual(_scan_control(data), len(sequence))
+                data.extend(b'\x1b[1m')
+                self.assertEqual(_scan_control(data), len(sequence))
+
+    def test_scan_incomplete(self) -> None:
+        for sequence in self.SEQUENCES:
+            for length in range(len(sequence)):
+                with self.subTest(sequence=sequence, length=length):
+                    self.assertEqual(_scan_control(bytearray(sequence[:length])), 0)
+
+    def test_scan_malformed(self) -> None:
+        for data, expected in [
+            (b'x', -1),                 # not ESC
+            (b'\x1b\x1b', -2),          # ESC
+            (b'\x1b \x7f', -3),         # ESC with intermediate
+            (b'\x1b[1\x01', -4),        # CSI
+            (b'\x1b]1\x1bx', -5),       # OSC with ESC but not ST
+        ]:
+            with self.subTest(data=data):
+                self.assertEqual(_scan_control(bytearray(data)), expected)
+
+    def test_scan_resume(self) -> None:
+        # The ST's ESC is the last byte read, so the next scan must include it.
+        data = bytearray(b'\x1b]10;rgb:ff/00/80\x1b')
+        self.assertEqual(_scan_control(data), 0)
+        start = len(data) - 1
+        data.extend(b'\\\x1b[1m')
+        self.assertEqual(_scan_control(data, start), start + 2)
+
+        # Feed each sequence byte by byte, resuming like Terminal.read_control().
+        for sequence in self.SEQUENCES:
+            with self.subTest(sequence=sequence):
+                source = sequence + b'\x1b[1m'
+                data = bytearray()
+                start = 0
+                while (length := _scan_control(data, start)) == 0:
+                    start = max(len(data) - 1, 0)
+                    data.append(source[len(data)])
+                self.assertEqual(length, len(sequence))
+
+    def test_read_control_after_timeout(self) -> None:
+        master, slave = pty.openpty()
+        try:
+            with open(slave, 'w', closefd=False) as tty:
+                terminal = Terminal(input=tty, output=tty)
+                with terminal.cbreak_mode():
+                    # A lone ESC times out and must not linger in the buffer.
+                    os.write(master, b'\x1b')
+                    with self.assertRaises(TimeoutError):
+                        terminal.read_control()
+
+                    os.write(master, b'\x1b[12;3R')
+                    self.assertEqual(terminal.read_control(), b'\x1b[12;3R')
+        finally:
+            os.close(slave)
+            os.close(master)